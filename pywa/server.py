@@ -400,8 +400,8 @@ class Server:
     def _get_handler(self: "WhatsApp", update: dict) -> type[Handler] | None:
         """Get the handler for the given update."""
         try:
-            field = update["entry"][0]["changes"][0]["field"]
-            value = update["entry"][0]["changes"][0]["value"]
+            change = update["entry"][0]["changes"][0]
+            field, value = change["field"], change["value"]
         except (KeyError, IndexError, TypeError):  # this endpoint got non-expected data
             raise ValueError(f"Invalid update: {update}")
 
@@ -414,10 +414,10 @@ class Server:
                 return None
 
             if "messages" in value:
-                msg_type = value["messages"][0]["type"]
+                msg_type = (msg := value["messages"][0])["type"]
                 if msg_type == MessageType.INTERACTIVE:
                     try:
-                        interactive_type = value["messages"][0]["interactive"]["type"]
+                        interactive_type = msg["interactive"]["type"]
                     except KeyError:  # value with errors, when a user tries to send the interactive msg again
                         return MessageHandler
                     if (
@@ -327,8 +327,8 @@ class CallbackButton(BaseUserUpdate, Generic[CallbackDataT]):
         msg = (value := update["entry"][0]["changes"][0]["value"])["messages"][0]
         match msg_type := msg["type"]:
             case MessageType.INTERACTIVE:
-                title = msg["interactive"]["button_reply"]["title"]
-                data = msg["interactive"]["button_reply"]["id"]
+                reply = msg["interactive"]["button_reply"]
+                title, data = reply["title"], reply["id"]
             case MessageType.BUTTON:
                 title = msg["button"]["text"]
                 data = msg["button"]["payload"]
@@ -436,6 +436,7 @@ class CallbackSelection(BaseUserUpdate, Generic[CallbackDataT]):
     @classmethod
     def from_update(cls, client: "WhatsApp", update: dict) -> "CallbackSelection":
         msg = (value := update["entry"][0]["changes"][0]["value"])["messages"][0]
+        reply = msg["interactive"]["list_reply"]
         return cls(
             _client=client,
             raw=update,
@@ -445,9 +446,9 @@ class CallbackSelection(BaseUserUpdate, Generic[CallbackDataT]):
             from_user=User.from_dict(value["contacts"][0]),
             timestamp=datetime.datetime.fromtimestamp(int(msg["timestamp"])),
             reply_to_message=ReplyToMessage.from_dict(msg["context"]),
-            data=msg["interactive"]["list_reply"]["id"],
-            title=msg["interactive"]["list_reply"]["title"],
-            description=msg["interactive"]["list_reply"].get("description"),
+            data=reply["id"],
+            title=reply["title"],
+            description=reply.get("description"),
         )
 
 
@@ -113,7 +113,8 @@ class FlowCompletion(BaseUserUpdate):
     @classmethod
     def from_update(cls, client: WhatsApp, update: dict) -> FlowCompletion:
         msg = (value := update["entry"][0]["changes"][0]["value"])["messages"][0]
-        response: dict = json.loads(msg["interactive"]["nfm_reply"]["response_json"])
+        nfm_reply = msg["interactive"]["nfm_reply"]
+        response: dict = json.loads(nfm_reply["response_json"])
         try:
             flow_token = response.pop("flow_token")
         except KeyError:
@@ -131,7 +132,7 @@ class FlowCompletion(BaseUserUpdate):
             from_user=User.from_dict(value["contacts"][0]),
             timestamp=datetime.datetime.fromtimestamp(int(msg["timestamp"])),
             reply_to_message=ReplyToMessage.from_dict(msg["context"]),
-            body=msg["interactive"]["nfm_reply"]["body"],
+            body=nfm_reply["body"],
             token=flow_token,
             response=response,
         )
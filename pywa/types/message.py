@@ -1,13 +1,12 @@
-from __future__ import annotations
-
-from types import MappingProxyType
-
 """This module contains the types related to messages."""
 
+from __future__ import annotations
+
 __all__ = ["Message"]
 
 import dataclasses
 import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Iterable
 
 from ..errors import WhatsAppError
@@ -145,7 +144,7 @@ class Message(BaseUserUpdate):
         )
         try:
             usr = User.from_dict(value["contacts"][0])
-        except KeyError:
+        except (KeyError, IndexError):
             usr = User(
                 wa_id=msg["from"], name=None
             )  # some messages don't have contacts
@@ -1,9 +1,7 @@
-from __future__ import annotations
-
-from .callback import CallbackDataT
-
 """This module contains the types related to message status updates."""
 
+from __future__ import annotations
+
 __all__ = [
     "MessageStatus",
     "MessageStatusType",
@@ -20,6 +18,7 @@ from .. import utils
 from ..errors import WhatsAppError
 
 from .base_update import BaseUserUpdate  # noqa
+from .callback import CallbackDataT
 from .others import Metadata, User
 
 if TYPE_CHECKING:
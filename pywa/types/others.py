@@ -1,7 +1,7 @@
-from __future__ import annotations
-
 """Types for other objects."""
 
+from __future__ import annotations
+
 import dataclasses
 import importlib
 import logging
@@ -775,7 +775,7 @@ class ConversationalAutomation:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class BusinessPhoneNumber:
     """
     Represents a WhatsApp Business Phone Number.
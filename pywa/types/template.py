@@ -1,9 +1,7 @@
-from __future__ import annotations
-
-from .flows import FlowActionType
-
 """This module contains the types related to templates."""
 
+from __future__ import annotations
+
 __all__ = [
     "Template",
     "NewTemplate",
@@ -23,6 +21,7 @@ from .. import utils
 
 from .base_update import BaseUpdate  # noqa
 from .callback import CallbackDataT, _resolve_callback_data  # noqa
+from .flows import FlowActionType
 from .others import ProductsSection
 
 if TYPE_CHECKING:
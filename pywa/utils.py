@@ -146,13 +146,14 @@ class FromDict:
     # noinspection PyArgumentList
     @classmethod
     def from_dict(cls, data: dict, **kwargs):
-        return cls(
-            **{
-                k: v
-                for k, v in (data | kwargs).items()
-                if k in (f.name for f in dataclasses.fields(cls))
-            }
-        )
+        fields = cls._fields_names()
+        return cls(**{k: v for k, v in (data | kwargs).items() if k in fields})
+
+    @classmethod
+    @functools.cache
+    def _fields_names(cls) -> frozenset[str]:
+        """Get the names of the dataclass fields (cached per class)."""
+        return frozenset(f.name for f in dataclasses.fields(cls))
 
 
 FlowRequestDecryptor: TypeAlias = Callable[
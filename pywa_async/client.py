@@ -33,7 +33,6 @@ from .handlers import (
 )
 from pywa.types.base_update import BaseUpdate
 
-import logging
 import dataclasses
 import datetime
 import hashlib
@@ -90,8 +89,6 @@ from .types.flows import (
 from .types.others import InteractiveType
 from .utils import FastAPI, Flask
 
-_logger = logging.getLogger(__name__)
-
 
 class WhatsApp(_WhatsApp):
     def __init__(
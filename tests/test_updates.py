@@ -53,6 +53,18 @@ TYPES: dict[str, dict[str, list[Callable[[Any], bool]]]] = {
         "interactive_message_with_err": [
             lambda m: m.type == MessageType.INTERACTIVE and m.error is not None
         ],
+        "contact_without_profile": [
+            lambda m: m.from_user.wa_id == "972987654321",
+            lambda m: m.from_user.name is None,
+        ],
+        "empty_contacts": [
+            lambda m: m.from_user.wa_id == "972987654321",
+            lambda m: m.from_user.name is None,
+        ],
+        "contact_with_empty_profile": [
+            lambda m: m.from_user.wa_id == "972987654321",
+            lambda m: m.from_user.name is None,
+        ],
     },
     "callback_button": {
         "button": [lambda b: b.type == MessageType.INTERACTIVE],
@@ -71,6 +83,16 @@ TYPES: dict[str, dict[str, list[Callable[[Any], bool]]]] = {
     },
     "template_status": {
         "approved": [lambda s: s.event == TemplateStatus.TemplateEvent.APPROVED],
+        "rejected": [
+            lambda s: s.event == TemplateStatus.TemplateEvent.REJECTED,
+            lambda s: s.reason
+            == TemplateStatus.TemplateRejectionReason.INCORRECT_CATEGORY,
+        ],
+        "unknown_event": [
+            lambda s: s.event == TemplateStatus.TemplateEvent.UNKNOWN,
+            lambda s: s.reason == TemplateStatus.TemplateRejectionReason.NONE,
+            lambda s: s.other_info == "Some title: Some description",
+        ],
     },
     "flow_completion": {
         "completion": [